@@ -4,67 +4,134 @@ Compute Comparison Metrics for Merge Tools
 """
 
 import argparse
-import json
+import functools
+import hashlib
+import itertools
 import sys
+from array import array
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 from rich import print as rprint
-from rich.panel import Panel
-from rich.table import Table
 
-# --- Enums & Constants ---
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class ExecutionStatus(str, Enum):
-    SUCCESS = "SUCCESS"
-    CONFLICT = "CONFLICT"
-    FAILED = "FAILED"
-    NO_OUTPUT = "NO_OUTPUT"
-    UNKNOWN = "UNKNOWN_EXECUTION"
+# --- Enums & Constants ---
 
-class ComparisonStatus(str, Enum):
-    MATCH = "MATCH"
-    DIFFER = "DIFFER"
-    NO_OUTPUT = "NO_OUTPUT"
+# Integer values keep hot-path comparisons cheap and double as the codes of the
+# vectorized computations. Every execution status >= FAILED counts as an error.
+class ExecutionStatus(IntEnum):
+    SUCCESS = 0
+    CONFLICT = 1
+    FAILED = 2
+    NO_OUTPUT = 3
+    UNKNOWN = 4
+
+class ComparisonStatus(IntEnum):
+    MATCH = 0
+    DIFFER = 1
+    NO_OUTPUT = 2
+
+N_EXEC, N_COMP = len(ExecutionStatus), len(ComparisonStatus)
+
+CONFUSION_METRICS = ("TP", "TN", "FP", "FN", "error")
+PAIRWISE_METRICS = ("aTP", "aTN", "aFP", "aFN")
+METRIC = {name: idx for idx, name in enumerate(PAIRWISE_METRICS)}
+
+_EXEC_MAP = {
+    "SUCCESS": ExecutionStatus.SUCCESS,
+    "CONFLICT": ExecutionStatus.CONFLICT,
+    "FAILED": ExecutionStatus.FAILED,
+    "NO_OUTPUT": ExecutionStatus.NO_OUTPUT,
+    "UNKNOWN_EXECUTION": ExecutionStatus.UNKNOWN,
+}
+_COMP_MAP = {
+    "MATCH": ComparisonStatus.MATCH,
+    "DIFFER": ComparisonStatus.DIFFER,
+    "NO_OUTPUT": ComparisonStatus.NO_OUTPUT,
+}
+
+@functools.lru_cache(maxsize=None)
+def _parse_legacy_execution(exec_str: str) -> ExecutionStatus:
+    # Raw run_merge_examples.py values such as "CONFLICTS (exit 1)" or "FAILED (exit 2)"
+    if "FAILED" in exec_str: return ExecutionStatus.FAILED
+    if "SUCCESS" in exec_str: return ExecutionStatus.SUCCESS
+    if "CONFLICT" in exec_str: return ExecutionStatus.CONFLICT
+    return ExecutionStatus.NO_OUTPUT
+
+def parse_execution(exec_str: str) -> ExecutionStatus:
+    status = _EXEC_MAP.get(exec_str)
+    return status if status is not None else _parse_legacy_execution(exec_str)
 
 # --- Data Models ---
 
-@dataclass
+@dataclass(slots=True)
 class MetricBucket:
     """Holds counts and scenario names for a specific metric."""
     count: int = 0
     scenarios: List[str] = field(default_factory=list)
-
-    def add(self, scenario_name: str):
-        self.count += 1
-        self.scenarios.append(scenario_name)
+    # False when scenario names were deliberately not collected (--summary-only)
+    collected: bool = True
 
     @property
     def scenario_str(self) -> str:
+        if not self.collected:
+            return "(omitted)"
         return ", ".join(self.scenarios) if self.scenarios else "-"
 
-@dataclass
+@dataclass(slots=True)
 class ToolScenarioResult:
     execution: ExecutionStatus
     comparison: ComparisonStatus
 
-@dataclass
+@dataclass(eq=False)
+class ToolCodes:
+    """Execution and comparison codes of one tool, indexed by scenario position.
+
+    Instances hash and compare by `fingerprint`, a digest of the encoded results,
+    so they can be used as memoization keys.
+    """
+    scenarios: List[str]
+    exec_codes: np.ndarray
+    comp_codes: np.ndarray
+    fingerprint: bytes
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ToolCodes) and self.fingerprint == other.fingerprint
+
+@dataclass(slots=True)
 class SingleToolPairwiseStats:
-    """Holds the aTP, aTN, aFP, aFN stats for one tool in a specific pairing."""
-    atp: MetricBucket = field(default_factory=MetricBucket)
-    atn: MetricBucket = field(default_factory=MetricBucket)
-    afp: MetricBucket = field(default_factory=MetricBucket)
-    afn: MetricBucket = field(default_factory=MetricBucket)
-
-    def add(self, metric_type: str, scenario: str):
-        if metric_type == "aTP": self.atp.add(scenario)
-        elif metric_type == "aTN": self.atn.add(scenario)
-        elif metric_type == "aFP": self.afp.add(scenario)
-        elif metric_type == "aFN": self.afn.add(scenario)
-
-@dataclass
+    """Holds the aTP, aTN, aFP, aFN stats for one tool in a specific pairing, indexed by METRIC."""
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(len(PAIRWISE_METRICS), dtype=np.int64))
+    scenarios: List[List[str]] = field(default_factory=lambda: [[] for _ in PAIRWISE_METRICS])
+    collected: bool = True
+
+    @classmethod
+    def from_metrics(cls, metric_idx: np.ndarray, scenario_names: List[str], collect_scenarios: bool = True) -> 'SingleToolPairwiseStats':
+        """Builds the stats from one METRIC index per scenario, -1 meaning no metric."""
+        counts, scenarios = _group_by_label(metric_idx, len(PAIRWISE_METRICS), scenario_names, collect_scenarios)
+        if not collect_scenarios:
+            return cls(counts=counts, collected=False)
+        return cls(counts=counts, scenarios=scenarios)
+
+    def bucket(self, metric_idx: int) -> MetricBucket:
+        return MetricBucket(count=int(self.counts[metric_idx]), scenarios=self.scenarios[metric_idx], collected=self.collected)
+
+@dataclass(slots=True)
 class PairwiseResult:
     """Results of comparing Tool A vs Tool B."""
     tool_a_name: str
@@ -74,142 +141,237 @@ class PairwiseResult:
 
 # --- Logic ---
 
+def _group_by_label(labels: np.ndarray, n_labels: int, scenario_names: List[str],
+                    collect_scenarios: bool = True) -> Tuple[np.ndarray, List[List[str]]]:
+    """Counts the scenarios per label in 0..n_labels-1 (negative labels are ignored) and,
+    if requested, groups their names in scenario order."""
+    counts = np.bincount(labels[labels >= 0], minlength=n_labels).astype(np.int64)
+    if not collect_scenarios:
+        return counts, [[] for _ in range(n_labels)]
+    # A stable sort keeps scenario order within each label; negative labels sort first
+    order = np.argsort(labels, kind="stable")[labels.size - int(counts.sum()):]
+    groups = np.split(order, np.cumsum(counts)[:-1])
+    return counts, [[scenario_names[i] for i in group] for group in groups]
+
+def _confusion_label(execution: ExecutionStatus, comparison: ComparisonStatus) -> int:
+    if execution >= ExecutionStatus.FAILED:
+        return CONFUSION_METRICS.index("error")
+    is_merge = (execution == ExecutionStatus.SUCCESS)
+    is_correct = (comparison == ComparisonStatus.MATCH)
+    if is_merge:
+        return CONFUSION_METRICS.index("TN" if is_correct else "FN")
+    return CONFUSION_METRICS.index("TP" if is_correct else "FP")
+
+# CONFUSION_METRICS index for every (execution, comparison) combination, indexed by `execution * N_COMP + comparison`
+_CONFUSION_LUT = np.array([_confusion_label(e, c) for e in ExecutionStatus for c in ComparisonStatus], dtype=np.int8)
+
 class StatisticsCalculator:
     @staticmethod
-    def compute_confusion_matrix(tool_name: str, results: Dict[str, ToolScenarioResult]):
-        # Re-using the simplified logic for the basic confusion matrix
-        # (Since the user only asked to revert the Pairwise logic)
-        tp, tn, fp, fn, error = (MetricBucket() for _ in range(5))
-        
-        for scenario, res in results.items():
-            if res.execution in (ExecutionStatus.FAILED, ExecutionStatus.NO_OUTPUT, ExecutionStatus.UNKNOWN):
-                error.add(scenario)
-                continue
-
-            is_merge = (res.execution == ExecutionStatus.SUCCESS)
-            is_correct = (res.comparison == ComparisonStatus.MATCH)
-
-            if is_merge:
-                if is_correct: tn.add(scenario)
-                else: fn.add(scenario)
-            else:
-                if is_correct: tp.add(scenario)
-                else: fp.add(scenario)
-                    
-        return {"TP": tp, "TN": tn, "FP": fp, "FN": fn, "error": error}
+    @functools.lru_cache(maxsize=None)
+    def compute_confusion_matrix(tool_name: str, codes: ToolCodes, collect_scenarios: bool = True):
+        labels = _CONFUSION_LUT[codes.exec_codes.astype(np.intp) * N_COMP + codes.comp_codes]
+        counts, scenarios = _group_by_label(labels, len(CONFUSION_METRICS), codes.scenarios, collect_scenarios)
+        return {
+            key: MetricBucket(count=int(counts[idx]), scenarios=scenarios[idx], collected=collect_scenarios)
+            for idx, key in enumerate(CONFUSION_METRICS)
+        }
+
+# Debug messages attached to the pairwise decisions; `_DIVERGENCE` prints the full divergence report
+_MSG_B_RESCUED = "[green]{b} succeeded where {a} failed: {scenario}.[/green]"
+_MSG_B_RESCUED_WRONG = "[yellow]{b} succeeded where {a} failed, but wrong output: {scenario}.[/yellow]"
+_MSG_A_RESCUED = "[green]{a} succeeded where {b} failed: {scenario}.[/green]"
+_MSG_A_RESCUED_WRONG = "[yellow]{a} succeeded where {b} failed, but wrong output: {scenario}.[/yellow]"
+_MSG_SAME = "[yellow]Both tools same result for {scenario}.[/yellow]"
+_DIVERGENCE = None
+
+# METRIC index of one tool's side of a decision, keyed on (merged cleanly, output was the correct one)
+_OUTCOME_METRIC = {
+    (True, True): METRIC["aTN"], (False, True): METRIC["aTP"],
+    (True, False): METRIC["aFN"], (False, False): METRIC["aFP"],
+}
+
+def _outcome_metric(execution: ExecutionStatus, correct: bool) -> int:
+    return _OUTCOME_METRIC[execution == ExecutionStatus.SUCCESS, correct]
+
+def _classify_pair(exec_a: ExecutionStatus, exec_b: ExecutionStatus,
+                   comp_a: ComparisonStatus, comp_b: ComparisonStatus) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    """Decides one scenario of a pairwise comparison; returns (metric_a, metric_b, debug_message) with METRIC indices."""
+    # 1. A fails, B succeeds
+    if exec_a == ExecutionStatus.FAILED and exec_b != ExecutionStatus.FAILED:
+        if comp_b == ComparisonStatus.MATCH:
+            return None, _outcome_metric(exec_b, True), _MSG_B_RESCUED
+        return None, None, _MSG_B_RESCUED_WRONG
+
+    # 2. B fails, A succeeds
+    if exec_b == ExecutionStatus.FAILED and exec_a != ExecutionStatus.FAILED:
+        if comp_a == ComparisonStatus.MATCH:
+            return _outcome_metric(exec_a, True), None, _MSG_A_RESCUED
+        return None, None, _MSG_A_RESCUED_WRONG
+
+    # 3. Same execution status and same outcome (both MATCH or both DIFFER) -> Skip
+    if exec_a == exec_b and comp_a == comp_b:
+        return None, None, _MSG_SAME
+
+    # 4. Divergence: the tool that matched the expected output is the correct one
+    a_correct = comp_a == ComparisonStatus.MATCH
+    return _outcome_metric(exec_a, a_correct), _outcome_metric(exec_b, not a_correct), _DIVERGENCE
+
+def _pair_key(ea: int, eb: int, ca: int, cb: int) -> int:
+    return ((ea * N_EXEC + eb) * N_COMP + ca) * N_COMP + cb
+
+# `_pair_key` is the sum of a part that only depends on tool A and one that only depends on tool B
+def _key_part_a(ea, ca):
+    return ea * (N_EXEC * N_COMP * N_COMP) + ca * N_COMP
+
+def _key_part_b(eb, cb):
+    return eb * (N_COMP * N_COMP) + cb
+
+def _build_pair_table() -> List[Tuple[Optional[int], Optional[int], Optional[str]]]:
+    """Decides every (exec_a, exec_b, comp_a, comp_b) combination once, indexed by `_pair_key`."""
+    table = [None] * (N_EXEC * N_EXEC * N_COMP * N_COMP)
+    for exec_a, exec_b, comp_a, comp_b in itertools.product(ExecutionStatus, ExecutionStatus, ComparisonStatus, ComparisonStatus):
+        table[_pair_key(exec_a, exec_b, comp_a, comp_b)] = _classify_pair(exec_a, exec_b, comp_a, comp_b)
+    return table
+
+_PAIR_TABLE = _build_pair_table()
+
+def _build_pair_luts() -> Tuple[np.ndarray, np.ndarray]:
+    """Splits `_PAIR_TABLE` into two METRIC index arrays (-1 for no metric) for vectorized lookups."""
+    lut_a = np.full(len(_PAIR_TABLE), -1, dtype=np.int8)
+    lut_b = np.full(len(_PAIR_TABLE), -1, dtype=np.int8)
+    for key, (metric_a, metric_b, _) in enumerate(_PAIR_TABLE):
+        if metric_a is not None: lut_a[key] = metric_a
+        if metric_b is not None: lut_b[key] = metric_b
+    return lut_a, lut_b
+
+_PAIR_LUT_A, _PAIR_LUT_B = _build_pair_luts()
+
+def _noop(*args, **kwargs):
+    pass
+
+# Pairwise results keyed by (tool_a, fingerprint_a, tool_b, fingerprint_b, collect_scenarios)
+_PAIRWISE_CACHE: Dict[Tuple[str, bytes, str, bytes, bool], PairwiseResult] = {}
 
 class PairwiseComparator:
-    def __init__(self, data: Dict[str, Dict[str, ToolScenarioResult]], expected_map: Dict[str, str], debug: bool = False):
-        self.data = data
+    def __init__(self, codes: Dict[str, ToolCodes], expected_map: Dict[str, str], debug: bool = False,
+                 collect_scenarios: bool = True):
+        self.codes = codes
         self.expected_map = expected_map
         self.debug = debug
+        self.collect_scenarios = collect_scenarios
+        self.scenarios = list(expected_map)
+        # Fused (tool, scenario) matrices shared by every pairing, holding each tool's
+        # decision-key part for either position so that pairings only add them up
+        self.tool_index = {tool: idx for idx, tool in enumerate(codes)}
+        exec_arr = np.stack([c.exec_codes for c in codes.values()]).astype(np.int16)
+        comp_arr = np.stack([c.comp_codes for c in codes.values()]).astype(np.int16)
+        self.key_part_a = _key_part_a(exec_arr, comp_arr)
+        self.key_part_b = _key_part_b(exec_arr, comp_arr)
+        # Chosen once so that nothing is formatted per scenario when debug is off
+        self._log = self._print_decisions if debug else _noop
 
     def compare(self, tool_a: str, tool_b: str) -> PairwiseResult:
-        result = PairwiseResult(tool_a, tool_b)
-        
-        # Get all scenarios present in the expected map
-        scenarios = self.expected_map.keys()
-
-        for scenario in scenarios:
-            # Defaults
-            res_a = self.data[tool_a].get(scenario, ToolScenarioResult(ExecutionStatus.UNKNOWN, ComparisonStatus.NO_OUTPUT))
-            res_b = self.data[tool_b].get(scenario, ToolScenarioResult(ExecutionStatus.UNKNOWN, ComparisonStatus.NO_OUTPUT))
-
-            exec_a, comp_a = res_a.execution, res_a.comparison
-            exec_b, comp_b = res_b.execution, res_b.comparison
-
-            # --- Logic from original compute_comparison_metrics ---
-
-            # 1. A fails, B succeeds
-            if exec_a == ExecutionStatus.FAILED and exec_b != ExecutionStatus.FAILED:
-                if comp_b == ComparisonStatus.MATCH:
-                    if self.debug:
-                        rprint(f"[green]{tool_b} succeeded where {tool_a} failed: {scenario}.[/green]")
-                    metric = "aTN" if exec_b == ExecutionStatus.SUCCESS else "aTP"
-                    result.stats_b.add(metric, scenario)
-                else:
-                    if self.debug:
-                        rprint(f"[yellow]{tool_b} succeeded where {tool_a} failed, but wrong output: {scenario}.[/yellow]")
-                continue
-
-            # 2. B fails, A succeeds
-            if exec_b == ExecutionStatus.FAILED and exec_a != ExecutionStatus.FAILED:
-                if comp_a == ComparisonStatus.MATCH:
-                    if self.debug:
-                        rprint(f"[green]{tool_a} succeeded where {tool_b} failed: {scenario}.[/green]")
-                    metric = "aTN" if exec_a == ExecutionStatus.SUCCESS else "aTP"
-                    result.stats_a.add(metric, scenario)
-                else:
-                    if self.debug:
-                        rprint(f"[yellow]{tool_a} succeeded where {tool_b} failed, but wrong output: {scenario}.[/yellow]")
-                continue
-
-            # 3. Same Execution Status
-            if exec_a == exec_b:
-                # Same outcome (both MATCH or both DIFFER) -> Skip
-                if comp_a == comp_b:
-                    if self.debug:
-                        rprint(f"[yellow]Both tools same result for {scenario}.[/yellow]")
-                    continue
-
-                # Divergence
-                if self.debug:
-                    self._print_divergence(scenario, tool_a, res_a, tool_b, res_b)
-
-                if comp_a == ComparisonStatus.MATCH:
-                    # A is correct
-                    metric_a = "aTN" if exec_a == ExecutionStatus.SUCCESS else "aTP"
-                    metric_b = "aFN" if exec_b == ExecutionStatus.SUCCESS else "aFP"
-                    result.stats_a.add(metric_a, scenario)
-                    result.stats_b.add(metric_b, scenario)
-                else:
-                    # B is correct
-                    metric_b = "aTN" if exec_b == ExecutionStatus.SUCCESS else "aTP"
-                    metric_a = "aFN" if exec_a == ExecutionStatus.SUCCESS else "aFP"
-                    result.stats_b.add(metric_b, scenario)
-                    result.stats_a.add(metric_a, scenario)
-            
-            # 4. Different Execution Status (e.g. one Merged, one Conflict)
+        return next(self.compare_all([(tool_a, tool_b)]))
+
+    def compare_all(self, pairs: List[Tuple[str, str]]) -> Iterator[PairwiseResult]:
+        """Compares every pair in a single vectorized pass, yielding results in order.
+
+        Debug messages of a pair are printed right before its result is yielded.
+        """
+        collect = self.collect_scenarios
+        cache_keys = [(a, self.codes[a].fingerprint, b, self.codes[b].fingerprint, collect) for a, b in pairs]
+        # Debug runs always recompute so that the per-scenario messages are printed
+        pending = [i for i, key in enumerate(cache_keys) if self.debug or key not in _PAIRWISE_CACHE]
+        rows = {i: row for row, i in enumerate(pending)}
+
+        if pending:
+            idx_a = [self.tool_index[pairs[i][0]] for i in pending]
+            idx_b = [self.tool_index[pairs[i][1]] for i in pending]
+            # One decision key per (pending pair, scenario), see `_pair_key`
+            decision_keys = self.key_part_a[idx_a] + self.key_part_b[idx_b]
+            metrics_a = _PAIR_LUT_A[decision_keys]
+            metrics_b = _PAIR_LUT_B[decision_keys]
+
+        for i, ((tool_a, tool_b), cache_key) in enumerate(zip(pairs, cache_keys)):
+            if i in rows:
+                row = rows[i]
+                self._log(tool_a, tool_b, decision_keys[row])
+                _PAIRWISE_CACHE[cache_key] = PairwiseResult(
+                    tool_a, tool_b,
+                    SingleToolPairwiseStats.from_metrics(metrics_a[row], self.scenarios, collect),
+                    SingleToolPairwiseStats.from_metrics(metrics_b[row], self.scenarios, collect),
+                )
+            yield _PAIRWISE_CACHE[cache_key]
+
+    def _print_decisions(self, name_a: str, name_b: str, decision_keys: np.ndarray):
+        # Collected and printed at once: one Rich render per pair instead of one per scenario
+        table, divergence_lines = _PAIR_TABLE, self._divergence_lines
+        lines = []
+        for idx, (scenario, key) in enumerate(zip(self.scenarios, decision_keys.tolist())):
+            message = table[key][2]
+            if message is _DIVERGENCE:
+                lines.extend(divergence_lines(idx, name_a, name_b))
             else:
-                if self.debug:
-                    self._print_divergence(scenario, tool_a, res_a, tool_b, res_b)
-                
-                if comp_a == ComparisonStatus.MATCH:
-                    metric_a = "aTN" if exec_a == ExecutionStatus.SUCCESS else "aTP"
-                    metric_b = "aFN" if exec_b == ExecutionStatus.SUCCESS else "aFP"
-                    result.stats_a.add(metric_a, scenario)
-                    result.stats_b.add(metric_b, scenario)
-                else:
-                    metric_b = "aTN" if exec_b == ExecutionStatus.SUCCESS else "aTP"
-                    metric_a = "aFN" if exec_a == ExecutionStatus.SUCCESS else "aFP"
-                    result.stats_b.add(metric_b, scenario)
-                    result.stats_a.add(metric_a, scenario)
-        return result
-
-    def _print_divergence(self, scenario, name_a, res_a, name_b, res_b):
-        rprint(f"[bold red]Divergence detected between {name_a} and {name_b} for scenario {scenario}[/bold red]")
-        rprint(f"Expected: {self.expected_map.get(scenario)}")
-        rprint(f"{name_a} - Execution: {res_a.execution}, Comparison: {res_a.comparison}")
-        rprint(f"{name_b} - Execution: {res_b.execution}, Comparison: {res_b.comparison}\n")
+                lines.append(message.format(a=name_a, b=name_b, scenario=scenario))
+        if lines:
+            # Only debug runs print these, so only they set up a Rich console
+            from rich.console import Console
+            Console().print("\n".join(lines))
+
+    def _divergence_lines(self, idx: int, name_a: str, name_b: str) -> List[str]:
+        scenario = self.scenarios[idx]
+        codes_a, codes_b = self.codes[name_a], self.codes[name_b]
+        return [
+            f"[bold red]Divergence detected between {name_a} and {name_b} for scenario {scenario}[/bold red]",
+            f"Expected: {self.expected_map[scenario]}",
+            f"{name_a} - Execution: {ExecutionStatus(codes_a.exec_codes[idx]).name}, Comparison: {ComparisonStatus(codes_a.comp_codes[idx]).name}",
+            f"{name_b} - Execution: {ExecutionStatus(codes_b.exec_codes[idx]).name}, Comparison: {ComparisonStatus(codes_b.comp_codes[idx]).name}\n",
+        ]
 
 # --- Rendering ---
 
 class ResultsRenderer:
+    # When stdout is redirected (e.g. in CI), rows are written as plain tab-separated
+    # `context  tool  metric  count  scenarios` lines instead of going through Rich's layout engine
+    plain = not sys.stdout.isatty()
+
+    @staticmethod
+    def _print_plain_rows(context: str, tool_name: str, rows):
+        print("\n".join(f"{context}\t{tool_name}\t{label}\t{bucket.count}\t{bucket.scenario_str}" for label, bucket in rows))
+
     @staticmethod
     def print_confusion_matrix(tool_name: str, matrix: dict):
+        rows = [(key, matrix[key]) for key in CONFUSION_METRICS]
+        if ResultsRenderer.plain:
+            ResultsRenderer._print_plain_rows("confusion", tool_name, rows)
+            return
+
+        # Only imported when rendering for a terminal
+        from rich.panel import Panel
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Metric")
         table.add_column("Count")
         table.add_column("Scenarios")
 
-        for key in ["TP", "TN", "FP", "FN", "error"]:
-            bucket = matrix[key]
+        for key, bucket in rows:
             table.add_row(key, str(bucket.count), bucket.scenario_str)
 
         rprint(Panel(table, title=f"[bold]Tool: {tool_name}[/bold]", border_style="magenta"))
 
     @staticmethod
     def print_pairwise(result: PairwiseResult):
+        if ResultsRenderer.plain:
+            context = f"{result.tool_a_name} vs {result.tool_b_name}"
+            for tool_name, stats in ((result.tool_a_name, result.stats_a), (result.tool_b_name, result.stats_b)):
+                rows = [(label, stats.bucket(idx)) for idx, label in enumerate(PAIRWISE_METRICS)]
+                ResultsRenderer._print_plain_rows(context, tool_name, rows)
+            return
+
+        from rich.panel import Panel
+        from rich.table import Table
+
         rprint(Panel(f"[bold]Comparison between {result.tool_a_name} and {result.tool_b_name}[/bold]", border_style="blue"))
         
         def render_stats(tool_name: str, stats: SingleToolPairwiseStats):
@@ -218,15 +380,8 @@ class ResultsRenderer:
             table.add_column("Count", justify="right")
             table.add_column("Scenarios")
             
-            # Use specific order from original script
-            metrics = [
-                ("aTP", stats.atp),
-                ("aTN", stats.atn),
-                ("aFP", stats.afp),
-                ("aFN", stats.afn)
-            ]
-            
-            for label, bucket in metrics:
+            for idx, label in enumerate(PAIRWISE_METRICS):
+                bucket = stats.bucket(idx)
                 table.add_row(label, str(bucket.count), bucket.scenario_str)
             
             rprint(table)
@@ -238,38 +393,74 @@ class ResultsRenderer:
 
 # --- Main ---
 
-def load_data(json_path: Path) -> Tuple[Dict[str, Dict[str, ToolScenarioResult]], Dict[str, str]]:
-    with open(json_path, 'r') as f:
-        raw_data = json.load(f)
-
-    tool_results = { "diff3": {}, "mergiraf-semi": {}, "mergiraf": {} }
+def iter_scenarios(json_path: Path) -> Iterator[Tuple[str, dict]]:
+    """Yields (scenario, data) pairs, streaming the file one scenario at a time when ijson is available."""
+    if ijson is None and orjson is not None:
+        yield from orjson.loads(json_path.read_bytes()).items()
+        return
+    with open(json_path, 'rb') as f:
+        if ijson is None:
+            import json  # Last-resort parser, only needed without ijson and orjson
+            yield from json.load(f).items()
+        else:
+            yield from ijson.kvitems(f, '')
+
+@functools.lru_cache(maxsize=None)
+def parse_result(exec_str: str, comp_str: str) -> ToolScenarioResult:
+    """Returns the shared result for a raw (execution, comparison) pair; only a handful of them ever occur."""
+    return ToolScenarioResult(parse_execution(exec_str), _COMP_MAP.get(comp_str, ComparisonStatus.DIFFER))
+
+def encode_results(scenario_names: List[str], exec_codes: array, comp_codes: array) -> ToolCodes:
+    exec_codes = np.frombuffer(exec_codes, dtype=np.int8)
+    comp_codes = np.frombuffer(comp_codes, dtype=np.int8)
+
+    digest = hashlib.blake2b(digest_size=16)
+    for name in scenario_names:
+        digest.update(name.encode())
+        digest.update(b"\0")
+    digest.update(exec_codes.tobytes())
+    digest.update(comp_codes.tobytes())
+
+    return ToolCodes(scenario_names, exec_codes, comp_codes, digest.digest())
+
+def load_data(json_path: Path) -> Tuple[Dict[str, str], Dict[str, ToolCodes]]:
+    # Codes are appended as scenarios stream in, so that at most one scenario's parsed
+    # data is held in memory besides these compact arrays
+    tool_codes = {tool: (array('b'), array('b')) for tool in ("diff3", "mergiraf-semi", "mergiraf")}
     expected_map = {}
+    rows = {}  # Scenario -> its position in the arrays
 
-    for scenario, data in raw_data.items():
-        expected_map[scenario] = data.get("expected", "UNKNOWN")
-        
-        for tool in tool_results.keys():
-            t_data = data.get(tool, {})
-            # Safely handle enums that might match partial strings from original JSON
-            exec_str = t_data.get("execution", "NO_OUTPUT")
-            comp_str = t_data.get("comparison", "NO_OUTPUT")
-            
-            # Map raw strings to Enums (simple mapping)
-            if "FAILED" in exec_str: e_stat = ExecutionStatus.FAILED
-            elif "SUCCESS" in exec_str: e_stat = ExecutionStatus.SUCCESS
-            elif "CONFLICT" in exec_str: e_stat = ExecutionStatus.CONFLICT
-            else: e_stat = ExecutionStatus.NO_OUTPUT
-            
-            c_stat = ComparisonStatus.MATCH if comp_str == "MATCH" else ComparisonStatus.DIFFER
-            if comp_str == "NO_OUTPUT": c_stat = ComparisonStatus.NO_OUTPUT
+    # Bound once, outside the per-scenario loop
+    per_tool = [(tool, exec_codes, comp_codes, exec_codes.append, comp_codes.append)
+                for tool, (exec_codes, comp_codes) in tool_codes.items()]
+    parse = parse_result
+    empty = {}
 
-            tool_results[tool][scenario] = ToolScenarioResult(e_stat, c_stat)
+    for scenario, data in iter_scenarios(json_path):
+        expected_map[scenario] = data.get("expected", "UNKNOWN")
+        # ijson yields a repeated key again; like json.load and orjson, the repeat keeps the first
+        # position and takes the last value, so results never depend on the installed parser
+        row = rows.get(scenario)
+        if row is None:
+            rows[scenario] = len(rows)
+
+        for tool, exec_codes, comp_codes, add_exec, add_comp in per_tool:
+            t_data = data.get(tool, empty)
+            result = parse(t_data.get("execution", "NO_OUTPUT"), t_data.get("comparison", "NO_OUTPUT"))
+            if row is None:
+                add_exec(result.execution)
+                add_comp(result.comparison)
+            else:
+                exec_codes[row] = result.execution
+                comp_codes[row] = result.comparison
 
-    return tool_results, expected_map
+    scenario_names = list(expected_map)
+    return expected_map, {tool: encode_results(scenario_names, *codes) for tool, codes in tool_codes.items()}
 
 def main():
     parser = argparse.ArgumentParser(description="Compute comparison metrics from scenarios.json")
     parser.add_argument("--debug", action="store_true", help="Enable detailed debug output")
+    parser.add_argument("--summary-only", action="store_true", help="Only report metric counts, without the contributing scenarios")
     args = parser.parse_args()
 
     repo_root = Path(__file__).resolve().parents[1]
@@ -279,23 +470,22 @@ def main():
         rprint(f"[red]scenarios.json not found at {scenarios_json}[/red]")
         sys.exit(1)
 
-    tool_data, expected_map = load_data(scenarios_json)
+    expected_map, tool_codes = load_data(scenarios_json)
 
     # 1. Confusion Matrices
-    for tool_name, results in tool_data.items():
-        matrix = StatisticsCalculator.compute_confusion_matrix(tool_name, results)
+    for tool_name, codes in tool_codes.items():
+        matrix = StatisticsCalculator.compute_confusion_matrix(tool_name, codes, not args.summary_only)
         ResultsRenderer.print_confusion_matrix(tool_name, matrix)
 
     # 2. Pairwise Comparisons
-    comparator = PairwiseComparator(tool_data, expected_map, debug=args.debug)
+    comparator = PairwiseComparator(tool_codes, expected_map, debug=args.debug, collect_scenarios=not args.summary_only)
     pairs = [
         ("diff3", "mergiraf"),
         ("diff3", "mergiraf-semi"),
         ("mergiraf-semi", "mergiraf")
     ]
 
-    for t_a, t_b in pairs:
-        result = comparator.compare(t_a, t_b)
+    for result in comparator.compare_all(pairs):
         ResultsRenderer.print_pairwise(result)
 
 if __name__ == "__main__":
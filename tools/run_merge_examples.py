@@ -5,26 +5,56 @@ Produces a `report/` folder inside each scenario with merged outputs and diffs a
 """
 
 import argparse
+import asyncio
+import difflib
+import functools
+import hashlib
+import itertools
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from rich import print as rprint
-from rich.console import Group
-from rich.panel import Panel
-from rich.table import Table
 
 # --- Configuration & Constants ---
 
+# Style tags used in this script's messages, e.g. `[bold green]` or `[/dim]`
+MARKUP_RE = re.compile(r"\[/?[a-z][a-z ]*\]")
+
+def plain_print(*objects):
+    """Prints messages without their Rich markup; `main` swaps in Rich's print on a terminal."""
+    print(*(MARKUP_RE.sub("", str(o)) for o in objects))
+
+# Rich is only imported when rendering for a terminal: by `main` for messages, and by the Rich
+# branch of `display_scenario_result`
+rprint = plain_print
+
+# Every conflict hunk opens with this marker line, so it alone tells whether any are present.
+# Anchoring it to a line start keeps `<<<<<<<` inside code or string literals from counting
+CONFLICT_START_RE = re.compile(rb"^<<<<<<<(?:[ \r]|$)", re.MULTILINE)
+
+# Part of every cached result's key: bump it whenever the way results are derived from a tool's
+# exit code and output changes (status or marker rules, comparison), so older caches are not replayed
+CACHE_VERSION = 1
+
 @dataclass
 class Config:
     repo_root: Path
     examples_dir: Path
+    target_dir: Path  # cargo's build directory
     dry_run: bool
     build: bool
+    force: bool
+    plain: bool
+    jobs: int  # scenarios run at once, each in its own worker process
+    selected: List[str] = field(default_factory=list)  # scenario names to run; empty runs all
 
     @classmethod
     def from_args(cls, args: argparse.Namespace) -> 'Config':
@@ -32,8 +62,15 @@ class Config:
         return cls(
             repo_root=repo_root,
             examples_dir=repo_root / "examples" / "swift",
+            # Honours CARGO_TARGET_DIR the way `cargo build` from the repo root does
+            target_dir=repo_root / os.environ.get("CARGO_TARGET_DIR", "target"),
             dry_run=args.dry_run,
-            build=args.build
+            build=args.build,
+            force=args.force,
+            jobs=args.jobs,
+            # Rich rendering only pays off on a terminal, and dry runs have nothing to lay out
+            plain=args.plain or args.dry_run or not sys.stdout.isatty(),
+            selected=args.scenarios
         )
 
 # --- Domain Models ---
@@ -62,8 +99,8 @@ class Scenario:
     left: Path
     right: Path
     expected: Path
-    report_dir: Path
-    diffs_dir: Path
+    report_dir: Path = field(init=False)
+    diffs_dir: Path = field(init=False)
 
     def __post_init__(self):
         self.report_dir = self.path / "report"
@@ -71,9 +108,7 @@ class Scenario:
 
     @classmethod
     def from_path(cls, path: Path) -> Optional['Scenario']:
-        if not path.is_dir():
-            return None
-        
+        """Builds the scenario stored in directory `path`, or returns None if it lacks input files."""
         # Define expected files
         s = cls(
             name=path.name,
@@ -81,37 +116,53 @@ class Scenario:
             base=path / "base.swift",
             left=path / "left.swift",
             right=path / "right.swift",
-            expected=path / "expected.swift",
-            report_dir=path / "report",
-            diffs_dir=path / "report" / "diffs"
+            expected=path / "expected.swift"
         )
         
         # Validation
-        missing = [f.name for f in (s.base, s.left, s.right, s.expected) if not f.exists()]
+        # One directory listing instead of a stat per input file
+        with os.scandir(path) as entries:
+            present = {e.name for e in entries}
+        missing = [f.name for f in (s.base, s.left, s.right, s.expected) if f.name not in present]
         if missing:
             rprint(f"[yellow]Skipping {s.name}: Missing files {missing}[/yellow]")
             return None
             
         return s
 
+    @functools.cached_property
+    def expected_bytes(self) -> bytes:
+        """expected.swift, read on first use and shared by every tool's comparison."""
+        return self.expected.read_bytes()
+
     def prepare_dirs(self):
-        self.report_dir.mkdir(parents=True, exist_ok=True)
+        # diffs/ lives inside report/, so one call creates both
         self.diffs_dir.mkdir(parents=True, exist_ok=True)
 
+# Input files in the order mergiraf takes them; tools run from the scenario directory
+MERGE_INPUTS = ("base.swift", "left.swift", "right.swift")
+
 class MergeTool:
-    def __init__(self, name: str, cmd_template: List[str], accepted_exit_codes: List[int] = None):
+    def __init__(self, name: str, cmd_template: List[str], accepted_exit_codes: List[int] = None,
+                 inputs: Tuple[str, ...] = MERGE_INPUTS):
         self.name = name
         self.cmd_template = cmd_template
         self.accepted_exit_codes = accepted_exit_codes or [0]
-
-    def run(self, scenario: Scenario, config: Config) -> ToolResult:
+        # Scenario-independent parts, computed once per tool instead of per run
+        self.full_cmd = cmd_template + list(inputs)
+        self.out_name = f"merged_{name.replace('-', '_')}.swift"
+        self.stderr_name = f"{self.out_name}.stderr"
+        self.tag = f"{name}_vs_expected"
+        self.diff_name = f"{self.tag}.diff"
+        # Identifies this tool's results in the result cache; rebuilding the executable changes its mtime
+        executable = shutil.which(cmd_template[0])
+        self.cache_id = ([CACHE_VERSION, self.full_cmd, sorted(self.accepted_exit_codes), os.stat(executable).st_mtime_ns]
+                         if executable else None)
+
+    async def run(self, scenario: Scenario, config: Config) -> ToolResult:
         logs = []
-        out_path = scenario.report_dir / f"merged_{self.name.replace('-', '_')}.swift"
-        stderr_path = scenario.report_dir / f"{out_path.name}.stderr"
-        
-        # Reset files
-        out_path.write_text("")
-        stderr_path.write_text("")
+        out_path = scenario.report_dir / self.out_name
+        stderr_path = scenario.report_dir / self.stderr_name
 
         logs.append(f"[cyan]Running: {self.name}[/cyan]")
 
@@ -121,38 +172,34 @@ class MergeTool:
 
         # Execute
         # We run from the scenario directory to ensure tools use relative paths in conflict markers
-        try:            
-            full_cmd = self.cmd_template + ["base.swift", "left.swift", "right.swift"]
-            if self.name == "diff3":
-                # Git merge-file order: <current/left> <base> <other/right>
-                full_cmd = self.cmd_template + ["left.swift", "base.swift", "right.swift"]
-
-            result = subprocess.run(
-                full_cmd,
-                cwd=str(scenario.path),
-                capture_output=True,
-                text=True
-            )
-            
-            # Write output
-            out_content = result.stdout or ""
-            out_path.write_text(out_content)
-            
-            if result.stderr:
-                stderr_path.write_text(result.stderr)
+        try:
+            # The tool writes straight into the report files; opening them also clears
+            # the previous run's outputs should the executable turn out to be missing
+            with open(out_path, "w+b") as out_fh, open(stderr_path, "wb") as err_fh:
+                proc = await asyncio.create_subprocess_exec(
+                    *self.full_cmd,
+                    cwd=scenario.path,
+                    stdout=out_fh,
+                    stderr=err_fh
+                )
+                await proc.wait()
+                # Read back through the same descriptor rather than reopening the file
+                out_fh.seek(0)
+                merged = out_fh.read()
 
             # Determine Status
             status = Status.FAILED
-            if result.returncode in self.accepted_exit_codes:
-                has_markers = any(m in out_content for m in ("<<<<<<<", "|||||||", "=======", ">>>>>>>"))
-                if has_markers:
-                    logs.append(f"  [yellow]⚠ {self.name} exit {result.returncode} (conflicts present)[/yellow]")
+            if proc.returncode in self.accepted_exit_codes:
+                # An accepted non-zero exit already signals conflicts; only a clean exit is
+                # double-checked for markers, which skips the scan on every conflicting merge
+                if proc.returncode != 0 or CONFLICT_START_RE.search(merged):
+                    logs.append(f"  [yellow]⚠ {self.name} exit {proc.returncode} (conflicts present)[/yellow]")
                     status = Status.CONFLICTS
                 else:
-                    logs.append(f"  [green]✓ {self.name} exit: {result.returncode}[/green]")
+                    logs.append(f"  [green]✓ {self.name} exit: {proc.returncode}[/green]")
                     status = Status.SUCCESS
             else:
-                logs.append(f"  [red]✗ failed (exit {result.returncode}), see {stderr_path.name}[/red]")
+                logs.append(f"  [red]✗ failed (exit {proc.returncode}), see {stderr_path.name}[/red]")
                 status = Status.FAILED
 
         except FileNotFoundError:
@@ -160,74 +207,202 @@ class MergeTool:
             return ToolResult(self.name, Status.FAILED, -1, "ERR", out_path, logs)
 
         # Compare vs Expected
-        comp_status = self._compare(scenario, out_path, logs, config)
+        comp_status = self._compare(scenario, out_path, merged, logs, config)
         
-        return ToolResult(self.name, status, result.returncode, comp_status, out_path, logs)
+        return ToolResult(self.name, status, proc.returncode, comp_status, out_path, logs)
 
-    def _compare(self, scenario: Scenario, merged_path: Path, logs: List[str], config: Config) -> str:
-        tag = f"{self.name}_vs_expected"
-        diff_path = scenario.diffs_dir / f"{tag}.diff"
+    def _compare(self, scenario: Scenario, merged_path: Path, merged: bytes, logs: List[str], config: Config) -> str:
+        tag = self.tag
+        diff_path = scenario.diffs_dir / self.diff_name
         
         if config.dry_run:
             return "DRY_RUN"
             
-        if not merged_path.exists() or merged_path.stat().st_size == 0:
+        if not merged:
             logs.append(f"  [dim]{tag}: no output produced[/dim]")
+            diff_path.unlink(missing_ok=True)
             return "DIFFER"
 
-        # Run diff
-        cmd = ["diff", "-u", str(scenario.expected.name), str(merged_path.name)]
-        # We run diff from inside report dir or using absolute paths? 
-        # Using absolute paths is safer.
-        cmd = ["diff", "-u", str(scenario.expected), str(merged_path)]
-        
-        r = subprocess.run(cmd, capture_output=True, text=True)
-        diff_path.write_text(r.stdout or "")
-        
-        if diff_path.stat().st_size > 0:
-            logs.append(f"  [red]✗ {tag}: DIFFER (see {diff_path.name})[/red]")
-            return "DIFFER"
-        else:
+        # Identical bytes need no diff at all
+        expected = scenario.expected_bytes
+        if merged == expected:
             logs.append(f"  [green]✓ {tag}: MATCH[/green]")
             diff_path.unlink(missing_ok=True)
             return "MATCH"
 
+        # Diffed as bytes, so outputs never go through a text codec. A missing final newline
+        # is marked the way `diff -u` does, so lines are not run together
+        diff = difflib.diff_bytes(
+            difflib.unified_diff,
+            expected.splitlines(keepends=True),
+            merged.splitlines(keepends=True),
+            fromfile=bytes(scenario.expected),
+            tofile=bytes(merged_path)
+        )
+        with open(diff_path, "wb") as fh:
+            fh.writelines(line if line.endswith(b"\n") else line + b"\n\\ No newline at end of file\n" for line in diff)
+        logs.append(f"  [red]✗ {tag}: DIFFER (see {diff_path.name})[/red]")
+        return "DIFFER"
+
+class ResultCache:
+    """A scenario's `report/cache.json`: tool results from earlier runs, keyed on the tool's executable
+    and on the scenario's files. Those are recognised by mtime, or failing that by content hash."""
+
+    def __init__(self, scenario: Scenario, load: bool = True):
+        self.scenario = scenario
+        self.path = scenario.report_dir / "cache.json"
+        self.inputs = [os.stat(f).st_mtime_ns for f in (scenario.base, scenario.left, scenario.right, scenario.expected)]
+        self.entries = {}
+        self.dirty = False
+        if load:
+            try:
+                entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                entries = None  # Missing or unreadable: everything runs again
+            if isinstance(entries, dict):
+                self.entries = entries
+
+    @functools.cached_property
+    def digest(self) -> str:
+        """Content hash of the scenario's files, computed at most once per scenario: whenever a tool's
+        result is stored, or when a cached entry's mtimes no longer match."""
+        h = hashlib.blake2b(digest_size=16)
+        for data in (self.scenario.base.read_bytes(), self.scenario.left.read_bytes(),
+                     self.scenario.right.read_bytes(), self.scenario.expected_bytes):
+            h.update(len(data).to_bytes(8, "little"))
+            h.update(data)
+        return h.hexdigest()
+
+    def get(self, tool: MergeTool) -> Optional[ToolResult]:
+        entry = self.entries.get(tool.name)
+        if tool.cache_id is None or not isinstance(entry, dict) or entry.get("tool") != tool.cache_id:
+            return None
+        r = entry["result"]
+        # Replaying is only valid while the run's report files are still there; an empty output
+        # is the one DIFFER without a diff file
+        output_file = self.scenario.report_dir / r["output_file"]
+        try:
+            output_size = os.stat(output_file).st_size
+        except OSError:
+            return None
+        if r["comparison_status"] == "DIFFER" and output_size and not (self.scenario.diffs_dir / tool.diff_name).exists():
+            return None
+        if entry.get("inputs") != self.inputs:
+            # Touched but possibly unchanged files, e.g. after a checkout
+            if entry.get("digest") != self.digest:
+                return None
+            entry["inputs"] = self.inputs  # Lets the next run settle it by mtime again
+            self.dirty = True
+        logs = r["logs"] + [f"  [dim]{tool.name}: inputs unchanged, reused the previous result[/dim]"]
+        return ToolResult(tool.name, Status(r["status"]), r["exit_code"], r["comparison_status"], output_file, logs)
+
+    def store(self, tool: MergeTool, result: ToolResult):
+        if tool.cache_id is None:
+            return
+        self.entries[tool.name] = {
+            "tool": tool.cache_id,
+            "inputs": self.inputs,
+            "digest": self.digest,
+            "result": {
+                "status": result.status.value,
+                "exit_code": result.exit_code,
+                "comparison_status": result.comparison_status,
+                "output_file": result.output_file.name,
+                "logs": result.logs,
+            },
+        }
+        self.dirty = True
+
+    def write(self):
+        if self.dirty:
+            self.path.write_text(json.dumps(self.entries, indent=2))
+
 # --- Infrastructure Functions ---
 
-def run_build(config: Config):
-    """Builds the project using cargo if requested."""
+def start_build(config: Config) -> Optional[subprocess.Popen]:
+    """Starts `cargo build` in the background, so that scenario discovery can overlap it."""
     cargo_toml = config.repo_root / "Cargo.toml"
     if not cargo_toml.exists():
         rprint(f"[yellow]Cargo.toml not found at {config.repo_root}. Skipping build.[/yellow]")
-        return
+        return None
 
     rprint("[cyan]Building mergiraf via `cargo build`...[/cyan]")
-    if not config.dry_run:
-        r = subprocess.run(["cargo", "build"], cwd=str(config.repo_root))
-        if r.returncode != 0:
-            rprint("[yellow]cargo build failed; continuing but merges may fail.[/yellow]")
-            sys.exit(1)
-    else:
+    if config.dry_run:
         rprint("[dim]Dry run: cargo build skipped[/dim]")
+        return None
+    return subprocess.Popen(["cargo", "build"], cwd=str(config.repo_root))
+
+def finish_build(build: subprocess.Popen, required: bool):
+    """Waits for the build started by `start_build`; merges must not start before it is done.
+    A failed build only stops the run if it was `required` (--build)."""
+    if build.wait() != 0:
+        rprint("[yellow]cargo build failed; continuing but merges may fail.[/yellow]")
+        if required:
+            sys.exit(1)
 
-def display_scenario_result(scenario: Scenario, results: List[ToolResult]):
-    """Renders the results of a single scenario to the terminal using Rich."""
+def discover_scenarios(config: Config) -> List[Scenario]:
+    """Finds and validates the (selected) scenarios, in name order."""
+    # DirEntry.is_dir() answers from the directory listing, without a stat per entry
+    selected = set(config.selected)
+    with os.scandir(config.examples_dir) as entries:
+        scenario_dirs = sorted(
+            (Path(e.path) for e in entries if e.is_dir() and (not selected or e.name in selected)),
+            key=lambda p: p.name
+        )
+    unknown = sorted(selected.difference(p.name for p in scenario_dirs))
+    if unknown:
+        rprint(f"[yellow]No such scenarios: {unknown}[/yellow]")
+    # Validated here so that skip messages are not interleaved with the workers' results
+    return [s for s in map(Scenario.from_path, scenario_dirs) if s]
+
+def local_mergiraf(config: Config) -> Optional[str]:
+    """Returns this repository's debug build of mergiraf, if it has been built."""
+    local_build = config.target_dir / "debug" / "mergiraf"
+    if local_build.is_file() and os.access(local_build, os.X_OK):
+        return str(local_build)
+    return None
+
+def find_mergiraf(config: Config) -> Optional[str]:
+    """Resolves the mergiraf executable once per run: the local debug build first, then PATH."""
+    return local_mergiraf(config) or shutil.which("mergiraf")
+
+# Summary table columns as (header, style). Rich stores a table's cells in its Column
+# objects, so every table gets fresh columns built from these specs
+RESULT_COLUMNS = (("Tool", "cyan"), ("Status", ""), ("Comparison", ""), ("Output File", "dim"))
+# Any other status is shown in red
+STATUS_STYLES = {Status.SUCCESS: "green", Status.CONFLICTS: "yellow"}
+
+def display_scenario_result(scenario: Scenario, results: List[ToolResult], plain: bool = False):
+    """Renders the results of a single scenario to the terminal using Rich, or as plain lines."""
     log_content = []
     
     # Aggregate logs
     for res in results:
         log_content.extend(res.logs)
-    
+
+    if plain:
+        # Logs, then one tab-separated `tool  status  comparison  output` row per tool
+        log_content.append(f"Report saved to: {scenario.report_dir}")
+        log_content.extend(
+            f"{res.tool_name}\t{res.status.value} ({res.exit_code})\t{res.comparison_status}\t{res.output_file.name}"
+            for res in results
+        )
+        plain_print(f"Scenario: {scenario.name}\n" + "\n".join(log_content) + "\n")
+        return
+
+    # After the first scenario these imports are only `sys.modules` lookups
+    from rich import print as rich_print
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Column, Table
+
     # Create Summary Table
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Tool", style="cyan")
-    table.add_column("Status")
-    table.add_column("Comparison")
-    table.add_column("Output File", style="dim")
+    columns = (Column(header, style=style) for header, style in RESULT_COLUMNS)
+    table = Table(*columns, show_header=True, header_style="bold magenta")
 
     for res in results:
         # Style the status
-        status_style = "green" if res.status == Status.SUCCESS else "yellow" if res.status == Status.CONFLICTS else "red"
+        status_style = STATUS_STYLES.get(res.status, "red")
         status_text = f"{res.status.value} ({res.exit_code})"
         
         # Style the comparison
@@ -245,49 +420,93 @@ def display_scenario_result(scenario: Scenario, results: List[ToolResult]):
     
     # Group logs and table
     content = Group("\n".join(log_content), "", table)
-    rprint(Panel(content, title=f"[bold]Scenario: {scenario.name}[/bold]", border_style="cyan"))
+    rich_print(Panel(content, title=f"[bold]Scenario: {scenario.name}[/bold]", border_style="cyan"))
+
+async def run_tools(scenario: Scenario, tools: List[MergeTool], config: Config) -> List[ToolResult]:
+    """Runs all tools on a scenario concurrently; they only share read-only inputs and write distinct files."""
+    return list(await asyncio.gather(*(tool.run(scenario, config) for tool in tools)))
+
+def process_scenario(scenario: Scenario, tools: List[MergeTool], config: Config) -> List[ToolResult]:
+    """Runs every tool on one scenario, reusing cached results for unchanged inputs.
+    Top-level so that it can run in a worker process; only the results are sent back."""
+    scenario.prepare_dirs()
+    # Dry runs neither use nor update the cache; --force skips reading it
+    cache = None if config.dry_run else ResultCache(scenario, load=not config.force)
+
+    results = {}
+    if cache:
+        for tool in tools:
+            cached = cache.get(tool)
+            if cached:
+                results[tool.name] = cached
+
+    to_run = [tool for tool in tools if tool.name not in results]
+    if to_run:
+        for tool, result in zip(to_run, asyncio.run(run_tools(scenario, to_run, config))):
+            results[tool.name] = result
+            if cache:
+                cache.store(tool, result)
+    if cache:
+        cache.write()
+
+    return [results[tool.name] for tool in tools]
 
 # --- Main Execution Flow ---
 
 def main():
+    global rprint
     parser = argparse.ArgumentParser(description="Run merge examples and generate reports")
     parser.add_argument("--build", action="store_true", help="Run `cargo build` at repo root before runs")
     parser.add_argument("--dry-run", action="store_true", help="Don't execute commands; just print what would run")
+    parser.add_argument("--plain", action="store_true", help="Print plain text instead of Rich panels (default when output is redirected)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of scenarios run in parallel (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rerun every tool even if a scenario's cached results are up to date")
+    parser.add_argument("scenarios", nargs="*", help="Only run these scenarios (directory names); runs all by default")
     args = parser.parse_args()
 
     config = Config.from_args(args)
+    if not config.plain:
+        from rich import print as rprint
 
     if not config.examples_dir.is_dir():
         rprint(f"[red]Examples directory not found: {config.examples_dir}[/red]")
         sys.exit(1)
 
-    if config.build:
-        run_build(config)
-
+    # mergiraf-semi runs the local build, so it is built once up front when missing rather than
+    # through `cargo run` in every scenario, where the workers would all queue on cargo's build lock.
+    # Scenarios are found while cargo builds; only the merges need the build. expected.swift is not
+    # read ahead here: each worker reads its own lazily (`Scenario.expected_bytes`)
+    build = start_build(config) if config.build or not local_mergiraf(config) else None
     rprint(f"[bold green]Running merge examples in: {config.examples_dir}[/bold green]")
+    scenarios = discover_scenarios(config)
+    if build:
+        finish_build(build, required=config.build)
 
     # Define Tools
     # Note: `mergiraf` accepts 0 (clean) and 1 (conflict) as valid exit codes
+    # Still missing only if the build failed or was skipped (dry run); the tools then stay in the
+    # results, reporting their executable as not found in every scenario
+    local_path = str(config.target_dir / "debug" / "mergiraf")
+    semi_bin = local_mergiraf(config) or local_path
     tools = [
-        MergeTool("diff3", ["git", "merge-file", "-p"], accepted_exit_codes=[0, 1]),
-        MergeTool("mergiraf-semi", ["cargo", "run", "--quiet", "--", "merge", "--semistructured=diff3"], accepted_exit_codes=[0, 1]),
-        MergeTool("mergiraf", [f"{config.repo_root}/target/debug/mergiraf", "merge"], accepted_exit_codes=[0, 1]),
+        # Git merge-file order: <current/left> <base> <other/right>
+        MergeTool("diff3", ["git", "merge-file", "-p"], accepted_exit_codes=[0, 1],
+                  inputs=("left.swift", "base.swift", "right.swift")),
+        MergeTool("mergiraf-semi", [semi_bin, "merge", "--semistructured=diff3"], accepted_exit_codes=[0, 1]),
     ]
 
-    scenarios_path = sorted(config.examples_dir.iterdir())
-    
-    for dir_path in scenarios_path:
-        scenario = Scenario.from_path(dir_path)
-        if not scenario:
-            continue
-
-        scenario.prepare_dirs()
-        
-        results = []
-        for tool in tools:
-            results.append(tool.run(scenario, config))
-            
-        display_scenario_result(scenario, results)
+    mergiraf_bin = find_mergiraf(config)
+    if not mergiraf_bin:
+        rprint("[yellow]mergiraf not found (neither target/debug/mergiraf nor on PATH); its runs will fail[/yellow]")
+    tools.append(MergeTool("mergiraf", [mergiraf_bin or local_path, "merge"], accepted_exit_codes=[0, 1]))
+
+    # Scenarios are independent: run them in worker processes, rendering in scenario order as they finish.
+    # No more workers than scenarios, since small selections would otherwise start idle processes
+    workers = max(1, min(config.jobs, len(scenarios)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        all_results = executor.map(process_scenario, scenarios, itertools.repeat(tools), itertools.repeat(config))
+        for scenario, results in zip(scenarios, all_results):
+            display_scenario_result(scenario, results, config.plain)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file